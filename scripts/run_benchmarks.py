@@ -6,15 +6,16 @@ Usage:
 """
 
 import argparse
+import csv
 import sys
-import pandas as pd
 from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Add the project root to path so the src package (relative imports) loads
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from benchmarks import compare_solvers
-from config import PDEConfig
+from src.benchmarks import RESULT_COLUMNS, compare_solvers
+from src.config import S_MAX_MULTIPLIER
+from src.pde_fixed_grid_cuda import HAVE_CUPY
 
 
 def main():
@@ -24,8 +25,12 @@ def main():
                        help='Output file for benchmark results')
     parser.add_argument('--num-tests', type=int, default=5,
                        help='Number of test cases')
+    parser.add_argument('--device', type=str, default='cpu', choices=['cpu', 'cuda'],
+                       help='Device for the fixed-grid solver (cuda needs CuPy)')
     
     args = parser.parse_args()
+    if args.device == 'cuda' and not HAVE_CUPY:
+        parser.error('--device cuda requires CuPy')
     
     # Default parameters
     base_params = {
@@ -44,6 +49,10 @@ def main():
             'strike': strike,
             'option_type': 'call'
         })
+
+    # One grid edge for the whole suite, so strikes are batched on a shared
+    # grid and each case's error does not depend on the others
+    base_params['Smax'] = S_MAX_MULTIPLIER * max(strikes)
     
     print(f"\n{'='*60}")
     print(f"Running Benchmarks")
@@ -53,15 +62,19 @@ def main():
     print(f"{'='*60}\n")
     
     try:
-        results = compare_solvers(test_cases, base_params)
-        
-        # Save results
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Combine all results into one dataframe
-        combined = pd.concat(results, keys=results.keys())
-        combined.to_csv(output_path)
+        # Stream rows to disk as each group is solved, tagged by solver;
+        # the header goes out first even if no group succeeds
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow([*RESULT_COLUMNS, 'solver'])
+
+            def write_rows(solver_name, rows):
+                writer.writerows(row + (solver_name,) for row in rows)
+
+            results = compare_solvers(test_cases, base_params, device=args.device, on_rows=write_rows)
         
         print(f"Results saved to {output_path}")
         print(f"\n{'='*60}")
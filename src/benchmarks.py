@@ -5,66 +5,209 @@ This module provides functions to benchmark the fixed-grid and adaptive
 PDE solvers against the analytical Black-Scholes solution.
 """
 
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+
 import numpy as np
-from typing import Dict, Tuple, List
+from typing import Callable, Dict, Tuple, List, Optional
 import pandas as pd
-from .config import PDEConfig
+from .config import BENCHMARK_MAX_WORKERS
 from . import bs_analytic
 from . import pde_fixed_grid
+from . import pde_fixed_grid_cuda
+
+try:
+    from .bs_analytic_simd import bs_price_u
+except ImportError:
+    # Numba is optional; references then come from bs_analytic.bs_price_array
+    bs_price_u = None
+
+# Columns of a benchmark result row, in order
+RESULT_COLUMNS = ('spot', 'strike', 'solver_price', 'bs_price', 'abs_error', 'rel_error')
+
+# Option parameters that define a shared PDE grid; test cases agreeing on
+# these are priced together by one batched solver call.
+_GROUP_KEYS = ('rate', 'volatility', 'time_to_expiry', 'option_type')
+
+
+def _group_test_cases(cases: List[Dict[str, float]]) -> Dict[Tuple, List[int]]:
+    """Map each shared-grid key to the indices of the test cases using it."""
+    groups: Dict[Tuple, List[int]] = {}
+    for idx, case in enumerate(cases):
+        key = tuple(case.get(k, 'call') if k == 'option_type' else case[k] for k in _GROUP_KEYS)
+        groups.setdefault(key, []).append(idx)
+    return groups
+
+
+def _solver_kwargs(params: Dict[str, float]) -> Dict[str, float]:
+    """Grid settings from ``params`` translated to the solver's keywords."""
+    kwargs = {k: v for k, v in params.items() if k not in _GROUP_KEYS}
+    if 'num_space_points' in kwargs:
+        kwargs['M'] = int(kwargs.pop('num_space_points')) - 1
+    return kwargs
+
+
+def _bs_reference(spots, strikes, expiries, rates, vols, flags) -> np.ndarray:
+    """Black-Scholes references for all test cases (``flags`` +1 call, -1 put)."""
+    if bs_price_u is not None:
+        return bs_price_u(spots, strikes, expiries, rates, vols, flags)
+    calls = bs_analytic.bs_price_array(spots, strikes, expiries, rates, vols, 'call')
+    puts = bs_analytic.bs_price_array(spots, strikes, expiries, rates, vols, 'put')
+    return np.where(flags > 0, calls, puts)
+
+
+def _carr_madan_batch(S0, K, T, r, sigma, option_type, **kwargs) -> np.ndarray:
+    """
+    Batched-solver adapter around ``bs_analytic.carr_madan_call_curve``.
+
+    One FFT prices every strike sharing a spot; puts follow from put-call
+    parity. Benchmark groups split only on rate, volatility, expiry and
+    type, so each spot's whole strike column arrives in one call. PDE grid
+    settings in ``kwargs`` (including ``Smax``) are ignored.
+    """
+    prices = np.empty(len(K))
+    for s0 in np.unique(S0):
+        mask = S0 == s0
+        prices[mask] = bs_analytic.carr_madan_call_curve(s0, K[mask], T, r, sigma)
+    if option_type == 'put':
+        prices += K * np.exp(-r * T) - S0
+    return prices
+
+
+def _picklable(obj) -> bool:
+    """Whether ``obj`` can be sent to a worker process."""
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+
+def _solve_group(group, solver_func, kwargs: Dict[str, float]) -> Optional[np.ndarray]:
+    """
+    Price one shared-grid group; top-level so it can run in a worker process.
+
+    Returns None (after reporting the error) if the solver fails.
+    """
+    (rate, vol, expiry, option_type), spots, strikes, group_cases = group
+    try:
+        return solver_func(spots, strikes, expiry, rate, vol, option_type, **kwargs)
+    except Exception as e:
+        print(f"Error in test cases {group_cases}: {e}")
+        return None
 
 
 def benchmark_solver(
     solver_func,
     params: Dict[str, float],
     test_cases: List[Dict[str, float]],
-    name: str = "Solver"
+    name: str = "Solver",
+    max_workers: Optional[int] = None,
+    on_rows: Optional[Callable[[List[Tuple[float, ...]]], None]] = None
 ) -> pd.DataFrame:
     """
     Benchmark a pricing solver against multiple test cases.
     
+    Test cases sharing rate, volatility, expiry and option type are
+    priced together with a single call to the batched ``solver_func``;
+    Black-Scholes references for all cases come from one ufunc call.
+    The batched PDE solver sizes its grid from the group's largest strike,
+    so pass a suite-wide ``'Smax'`` in ``params`` to keep each case's
+    error independent of which other cases are in the suite.
+    Independent groups are spread over a process pool when there are
+    enough of them to amortise its start-up cost.
+    
     Parameters
     ----------
     solver_func : callable
-        Pricing function to benchmark
+        Batched pricing function with signature
+        ``solver_func(S0, K, T, r, sigma, option_type, **kwargs)`` taking
+        arrays of spots and strikes and returning an array of prices
     params : dict
-        Configuration parameters
+        Configuration parameters shared by all test cases (grid settings
+        such as ``num_space_points`` and ``Smax`` are passed to the solver)
     test_cases : list
-        List of parameter dictionaries for test cases
+        List of parameter dictionaries for test cases; a key also given in
+        ``params`` raises ``ValueError``
     name : str
         Name of the solver
+    max_workers : int, optional
+        Process-pool size; defaults to ``os.cpu_count()`` capped at
+        ``BENCHMARK_MAX_WORKERS``. Groups are solved serially unless there
+        are at least twice as many groups as workers, since spawning the
+        pool would otherwise cost more than it saves. The pool also needs
+        a picklable ``solver_func`` (a module-level function); closures and
+        lambdas are always solved serially.
+    on_rows : callable, optional
+        Called with each group's result rows (tuples ordered as
+        ``RESULT_COLUMNS``) as soon as that group is solved, so results can
+        be written out while later groups are still running. Groups arrive
+        in completion order; failed groups produce no call.
     
     Returns
     -------
     pd.DataFrame
         Results dataframe with prices and errors
     """
-    results = []
     for tc in test_cases:
-        try:
-            price = solver_func(**tc, **params)
-            bs_price = bs_analytic.call_price(**tc) if tc.get('option_type', 'call') == 'call' else \
-                       bs_analytic.put_price(**tc)
-            error = abs(price - bs_price)
-            rel_error = error / bs_price if bs_price != 0 else 0
-            
-            results.append({
-                'spot': tc.get('spot'),
-                'strike': tc.get('strike'),
-                'solver_price': price,
-                'bs_price': bs_price,
-                'abs_error': error,
-                'rel_error': rel_error
-            })
-        except Exception as e:
-            print(f"Error in test case {tc}: {e}")
-    
-    df = pd.DataFrame(results)
-    return df
+        clash = sorted(set(tc) & set(params))
+        if clash:
+            raise ValueError(f"Test case {tc} repeats parameters {clash} also given in params")
+    cases = [{**tc, **params} for tc in test_cases]
+    kwargs = _solver_kwargs(params)
+
+    def column(key):
+        return np.array([c[key] for c in cases], dtype=float)
+
+    spots = column('spot')
+    strikes = column('strike')
+    flags = np.array([1.0 if c.get('option_type', 'call') == 'call' else -1.0 for c in cases])
+    bs_prices = _bs_reference(spots, strikes, column('time_to_expiry'), column('rate'), column('volatility'), flags)
+
+    groups = _group_test_cases(cases)
+    tasks = [(key, spots[idx], strikes[idx], [test_cases[i] for i in idx]) for key, idx in groups.items()]
+    solve = partial(_solve_group, solver_func=solver_func, kwargs=kwargs)
+
+    # Fill columns in place as groups finish; failed groups leave their
+    # rows unsolved and are dropped when the frame is built
+    solver_prices = np.empty(len(cases))
+    errors = np.empty(len(cases))
+    rel_errors = np.zeros(len(cases))
+    solved = np.zeros(len(cases), dtype=bool)
+    columns = (spots, strikes, solver_prices, bs_prices, errors, rel_errors)
+
+    def record(idx, prices):
+        if prices is None:
+            return
+        solver_prices[idx] = prices
+        errors[idx] = np.abs(solver_prices[idx] - bs_prices[idx])
+        nonzero = idx[bs_prices[idx] != 0]
+        rel_errors[nonzero] = errors[nonzero] / bs_prices[nonzero]
+        solved[idx] = True
+        if on_rows is not None:
+            on_rows(list(zip(*(col[idx].tolist() for col in columns))))
+
+    group_idx = [np.array(idx) for idx in groups.values()]
+    workers = max_workers or min(os.cpu_count() or 1, BENCHMARK_MAX_WORKERS)
+    if workers > 1 and len(tasks) >= 2 * workers and _picklable(solver_func):
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = {ex.submit(solve, task): idx for task, idx in zip(tasks, group_idx)}
+            for future in as_completed(futures):
+                record(futures[future], future.result())
+    else:
+        for task, idx in zip(tasks, group_idx):
+            record(idx, solve(task))
+
+    return pd.DataFrame({name: col[solved] for name, col in zip(RESULT_COLUMNS, columns)})
 
 
 def compare_solvers(
     test_cases: List[Dict[str, float]],
-    params: Dict[str, float]
+    params: Dict[str, float],
+    device: str = 'cpu',
+    on_rows: Optional[Callable[[str, List[Tuple[float, ...]]], None]] = None
 ) -> Dict[str, pd.DataFrame]:
     """
     Compare fixed-grid and adaptive solvers on the same test cases.
@@ -75,6 +218,12 @@ def compare_solvers(
         List of parameter dictionaries
     params : dict
         Configuration parameters
+    device : str
+        'cpu', or 'cuda' to run the fixed-grid solver on the GPU (needs
+        CuPy; only pays off for large surfaces)
+    on_rows : callable, optional
+        ``on_rows(solver_name, rows)``, forwarded to ``benchmark_solver``
+        so rows can be streamed out as each group is solved
     
     Returns
     -------
@@ -82,13 +231,37 @@ def compare_solvers(
         Dictionary with results for each solver
     """
     results = {}
+
+    def rows_for(solver_name):
+        return partial(on_rows, solver_name) if on_rows is not None else None
     
-    # Benchmark fixed-grid solver
-    results['fixed_grid'] = benchmark_solver(
-        pde_fixed_grid.price_option_fixed_grid,
+    # Benchmark fixed-grid solver; GPU groups are solved from this process
+    # only, since worker processes cannot share the CUDA context
+    if device == 'cuda':
+        results['fixed_grid'] = benchmark_solver(
+            pde_fixed_grid_cuda.price_batch_cuda,
+            params,
+            test_cases,
+            name='Fixed Grid (CUDA)',
+            max_workers=1,
+            on_rows=rows_for('fixed_grid')
+        )
+    else:
+        results['fixed_grid'] = benchmark_solver(
+            pde_fixed_grid.price_european_fixed_grid_batch,
+            params,
+            test_cases,
+            name='Fixed Grid',
+            on_rows=rows_for('fixed_grid')
+        )
+
+    # Carr-Madan FFT: one transform per spot prices the whole strike column
+    results['carr_madan'] = benchmark_solver(
+        _carr_madan_batch,
         params,
         test_cases,
-        name='Fixed Grid'
+        name='Carr-Madan FFT',
+        on_rows=rows_for('carr_madan')
     )
     
     return results
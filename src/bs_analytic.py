@@ -4,11 +4,31 @@ import math
 from dataclasses import dataclass
 from typing import Literal, Tuple
 
-from scipy.stats import norm
+import numpy as np
+from scipy.interpolate import CubicSpline
+from scipy.special import ndtr
 
 
 OptionType = Literal["call", "put"]
 
+_SQRT2 = math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _norm_cdf(x: float) -> float:
+    """
+    Standard normal CDF for a scalar, without SciPy dispatch overhead.
+
+    Written with ``erfc`` so the lower tail keeps full relative precision
+    (``1 + erf`` cancels to zero below about -8).
+    """
+    return 0.5 * math.erfc(-x / _SQRT2)
+
+
+def _norm_pdf(x: float) -> float:
+    """Standard normal PDF for a scalar."""
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
 
 def _validate_inputs(S0: float, K: float, T: float, r: float, sigma: float) -> None:
     """Basic input checks to avoid silent bugs."""
@@ -33,19 +53,104 @@ def _d1_d2(S0: float, K: float, T: float, r: float, sigma: float) -> Tuple[float
     return d1, d2
 
 
+def _d1_d2_precomp(S0, K, T, r, sigma, vol_sqrtT, inv_vol_sqrtT):
+    """
+    d1 and d2 given precomputed ``sigma*sqrt(T)`` and its reciprocal.
+
+    Skips validation; accepts scalars or arrays.
+    """
+    d1 = (np.log(S0 / K) + (r + 0.5 * sigma * sigma) * T) * inv_vol_sqrtT
+    d2 = d1 - vol_sqrtT
+    return d1, d2
+
+
 def bs_price(S0: float, K: float, T: float, r: float, sigma: float, option_type: OptionType) -> float:
 
     d1, d2 = _d1_d2(S0, K, T, r, sigma)
     disc = math.exp(-r * T)
 
     if option_type == "call":
-        return S0 * norm.cdf(d1) - K * disc * norm.cdf(d2)
+        return S0 * _norm_cdf(d1) - K * disc * _norm_cdf(d2)
     elif option_type == "put":
-        return K * disc * norm.cdf(-d2) - S0 * norm.cdf(-d1)
+        return K * disc * _norm_cdf(-d2) - S0 * _norm_cdf(-d1)
     else:
         raise ValueError("option_type must be 'call' or 'put'")
 
 
+def bs_price_array(S0, K, T, r, sigma, option_type: OptionType) -> np.ndarray:
+    """
+    Vectorised Black–Scholes price; array arguments are broadcast together.
+    """
+    S0, K, T, r, sigma = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (S0, K, T, r, sigma)))
+    _validate_inputs(S0.min(), K.min(), T.min(), r, sigma.min())
+
+    vol_sqrtT = sigma * np.sqrt(T)
+    d1, d2 = _d1_d2_precomp(S0, K, T, r, sigma, vol_sqrtT, 1.0 / vol_sqrtT)
+    disc = np.exp(-r * T)
+
+    if option_type == "call":
+        return S0 * ndtr(d1) - K * disc * ndtr(d2)
+    elif option_type == "put":
+        return K * disc * ndtr(-d2) - S0 * ndtr(-d1)
+    else:
+        raise ValueError("option_type must be 'call' or 'put'")
+
+
+def bs_call_price_batch(S0, K_array, T: float, r: float, sigma: float) -> np.ndarray:
+    """
+    Call prices for many strikes sharing scalar ``T``, ``r`` and ``sigma``.
+
+    ``sigma*sqrt(T)``, its reciprocal and the discount factor are computed
+    once for the whole batch.
+    """
+    K_array = np.asarray(K_array, dtype=float)
+    _validate_inputs(np.min(S0), K_array.min(), T, r, sigma)
+
+    vol_sqrtT = sigma * math.sqrt(T)
+    d1, d2 = _d1_d2_precomp(S0, K_array, T, r, sigma, vol_sqrtT, 1.0 / vol_sqrtT)
+    return S0 * ndtr(d1) - K_array * math.exp(-r * T) * ndtr(d2)
+
+
+def carr_madan_call_curve(
+    S0: float,
+    K_grid,
+    T: float,
+    r: float,
+    sigma: float,
+    alpha: float = 1.5,
+    N: int = 4096,
+    eta: float = 0.25,
+) -> np.ndarray:
+    """
+    Black–Scholes call prices for a whole strike grid from a single FFT.
+
+    Carr–Madan (1999): the damped call price ``exp(alpha*k) C(k)`` is
+    Fourier-inverted on a log-strike grid centred at ``log(S0)`` with
+    Simpson weights; ``eta`` is the spacing of the integration grid and the
+    log-strike spacing is ``2*pi / (N*eta)``. Prices at ``K_grid`` are
+    read off the FFT grid with a cubic spline.
+    """
+    _validate_inputs(S0, float(np.min(K_grid)), T, r, sigma)
+
+    lam = 2.0 * math.pi / (N * eta)
+    b = 0.5 * N * lam
+    x0 = math.log(S0)
+
+    v = eta * np.arange(N)
+    u = v - 1j * (alpha + 1.0)
+    charfn = np.exp(1j * u * (x0 + (r - 0.5 * sigma * sigma) * T) - 0.5 * sigma * sigma * T * u * u)
+    psi = math.exp(-r * T) * charfn / (alpha * alpha + alpha - v * v + 1j * (2.0 * alpha + 1.0) * v)
+
+    simpson = 3.0 + (-1.0) ** (np.arange(N) + 1)
+    simpson[0] = 1.0
+    x = np.exp(1j * v * (b - x0)) * psi * eta * simpson / 3.0
+
+    k = x0 - b + lam * np.arange(N)
+    curve = np.exp(-alpha * k) / math.pi * np.fft.fft(x).real
+
+    return CubicSpline(k, curve)(np.log(np.asarray(K_grid, dtype=float)))
+
+
 def bs_call_price(S0: float, K: float, T: float, r: float, sigma: float) -> float:
     return bs_price(S0, K, T, r, sigma, "call")
 
@@ -64,7 +169,7 @@ class Greeks:
 def bs_greeks(S0: float, K: float, T: float, r: float, sigma: float, option_type: OptionType) -> Greeks:
     d1, d2 = _d1_d2(S0, K, T, r, sigma)
 
-    pdf_d1 = norm.pdf(d1) 
+    pdf_d1 = _norm_pdf(d1)
     sqrtT = math.sqrt(T)
 
     gamma = pdf_d1 / (S0 * sigma * sqrtT)
@@ -72,9 +177,9 @@ def bs_greeks(S0: float, K: float, T: float, r: float, sigma: float, option_type
     vega = S0 * pdf_d1 * sqrtT
 
     if option_type == "call":
-        delta = norm.cdf(d1)
+        delta = _norm_cdf(d1)
     elif option_type == "put":
-        delta = norm.cdf(d1) - 1.0
+        delta = _norm_cdf(d1) - 1.0
     else:
         raise ValueError("option_type must be 'call' or 'put'")
 
@@ -0,0 +1,75 @@
+"""
+Numba ufunc version of the Black–Scholes formula for large batches.
+
+The normal CDF uses Hart's rational approximation (double precision,
+absolute error around 1e-14) instead of a libm ``erf`` call. The kernel
+still branches on ``|x|`` and calls ``exp``/``log``, so LLVM only partly
+vectorises it. Fast-math leaves out the no-NaN/no-inf assumptions so that
+invalid inputs come out as NaN.
+"""
+
+from __future__ import annotations
+
+import math
+
+from numba import njit, vectorize
+
+
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+# LLVM fast-math minus the no-NaN/no-inf assumptions
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit("float64(float64)", cache=True, fastmath=_FASTMATH, error_model="numpy")
+def _norm_cdf(x):
+    """Standard normal CDF via Hart (1968) algorithm 5666."""
+    ax = abs(x)
+    if ax > 37.0:
+        tail = 0.0
+    else:
+        e = math.exp(-0.5 * ax * ax)
+        if ax < 7.07106781186547:
+            num = 3.52624965998911e-02 * ax + 0.700383064443688
+            num = num * ax + 6.37396220353165
+            num = num * ax + 33.912866078383
+            num = num * ax + 112.079291497871
+            num = num * ax + 221.213596169931
+            num = num * ax + 220.206867912376
+            den = 8.83883476483184e-02 * ax + 1.75566716318264
+            den = den * ax + 16.064177579207
+            den = den * ax + 86.7807322029461
+            den = den * ax + 296.564248779674
+            den = den * ax + 637.333633378831
+            den = den * ax + 793.826512519948
+            den = den * ax + 440.413735824752
+            tail = e * num / den
+        else:
+            cf = ax + 0.65
+            cf = ax + 4.0 / cf
+            cf = ax + 3.0 / cf
+            cf = ax + 2.0 / cf
+            cf = ax + 1.0 / cf
+            tail = e / cf / _SQRT_2PI
+    return 1.0 - tail if x > 0.0 else tail
+
+
+@njit("float64(float64, float64, float64, float64, float64, float64)", cache=True, fastmath=_FASTMATH,
+      error_model="numpy")
+def _bs_price(S0, K, T, r, sigma, flag):
+    vol_sqrtT = sigma * math.sqrt(T)
+    d1 = (math.log(S0 / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrtT
+    d2 = d1 - vol_sqrtT
+    disc = math.exp(-r * T)
+    return flag * (S0 * _norm_cdf(flag * d1) - K * disc * _norm_cdf(flag * d2))
+
+
+@vectorize(["float64(float64, float64, float64, float64, float64, float64)"], target="cpu", fastmath=_FASTMATH, cache=True)
+def bs_price_u(S0, K, T, r, sigma, flag):
+    """
+    Black–Scholes price as a ufunc; ``flag`` is +1 for a call, -1 for a put.
+
+    Inputs broadcast like any NumPy ufunc. No input validation is done:
+    invalid parameters give NaN rather than raising.
+    """
+    return _bs_price(S0, K, T, r, sigma, flag)
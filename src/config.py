@@ -12,3 +12,5 @@ ERROR_TOLERANCE = 1e-4        # acceptable pricing error
 
 # Benchmark settings
 BENCHMARK_RUNS = 5            # how many times to time each method
+BENCHMARK_MAX_WORKERS = 8     # process-pool cap; PDE solves are memory-bound and
+                              # stop scaling once memory channels are saturated
@@ -0,0 +1,136 @@
+"""
+GPU version of the batched fixed-grid Crank-Nicolson solver.
+
+Only worth it for large batches (full strike surfaces): every option in
+the batch is marched through all time steps by its own CUDA thread in a
+single kernel launch. Grid values are stored node-major, ``V[i, b]``, so
+neighbouring threads touch neighbouring addresses. Requires CuPy.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    import cupy as cp
+    HAVE_CUPY = True
+except ImportError:
+    HAVE_CUPY = False
+
+from .pde_fixed_grid import OptionType, cn_coefficients, factor_tridiag, interp_uniform, resolve_grid
+
+
+_CN_MARCH_SRC = r"""
+extern "C" __global__
+void cn_march(double* V, const double* K, const double* w, const double* d_prime,
+              const double* upper_L, const double* lower_R, const double* diag_R,
+              const double* upper_R, const double* disc, const double A0,
+              const double Cm, const double Smax, const double dt,
+              const int is_call, const int m, const int N, const int B)
+{
+    const int b = blockDim.x * blockIdx.x + threadIdx.x;
+    if (b >= B) return;
+
+    // Node i of option b lives at V[i * B + b]; nodes 0 and m + 1 are the
+    // Dirichlet boundaries, 1..m the interior. disc[n] = exp(-r * tau_n).
+    #define AT(i) V[(i) * B + b]
+
+    const double Kb = K[b];
+    double V0_np1 = is_call ? 0.0 : Kb;
+    double VM_np1 = is_call ? Smax - Kb : 0.0;
+
+    for (int n = 0; n < N; ++n) {
+        const double V0_n = V0_np1;
+        const double VM_n = VM_np1;
+        V0_np1 = is_call ? 0.0 : Kb * disc[n + 1];
+        VM_np1 = is_call ? Smax - Kb * disc[n + 1] : 0.0;
+
+        double prev = AT(1);
+        AT(1) = diag_R[0] * prev + upper_R[0] * AT(2) + 0.5 * dt * A0 * (V0_n + V0_np1);
+
+        for (int k = 1; k < m; ++k) {
+            const double cur = AT(k + 1);
+            double rhs = lower_R[k - 1] * prev + diag_R[k] * cur;
+            if (k < m - 1) {
+                rhs += upper_R[k] * AT(k + 2);
+            } else {
+                rhs += 0.5 * dt * Cm * (VM_n + VM_np1);
+            }
+            AT(k + 1) = rhs - w[k] * AT(k);
+            prev = cur;
+        }
+
+        AT(m) = AT(m) / d_prime[m - 1];
+        for (int k = m - 2; k >= 0; --k) {
+            AT(k + 1) = (AT(k + 1) - upper_L[k] * AT(k + 2)) / d_prime[k];
+        }
+
+        AT(0) = V0_np1;
+        AT(m + 1) = VM_np1;
+    }
+
+    #undef AT
+}
+"""
+
+_THREADS_PER_BLOCK = 128
+
+_cn_march = cp.RawKernel(_CN_MARCH_SRC, "cn_march") if HAVE_CUPY else None
+
+
+def price_batch_cuda(
+    S0: np.ndarray | float,
+    K: np.ndarray | float,
+    T: float,
+    r: float,
+    sigma: float,
+    option_type: OptionType = "call",
+    M: int | None = None,
+    N: int | None = None,
+    Smax: float | None = None,
+) -> np.ndarray:
+    """
+    GPU drop-in for ``pde_fixed_grid.price_european_fixed_grid_batch``.
+
+    Same arguments, grid and results; the LHS is factored once on the host
+    and the whole time march runs on the device. Returns a NumPy array.
+    """
+    if not HAVE_CUPY:
+        raise ImportError("price_batch_cuda requires CuPy (pip install cupy-cuda12x)")
+
+    S0_vec, K_vec, M, N, Smax = resolve_grid(S0, K, T, sigma, option_type, M, N, Smax)
+
+    dS = Smax / M
+    dt = T / N
+
+    S = np.linspace(0.0, Smax, M + 1)
+    A0, Cm, bands_L, bands_R = cn_coefficients(S, dS, dt, r, sigma)
+
+    w = np.empty(M - 1, dtype=np.float64)
+    d_prime = np.empty(M - 1, dtype=np.float64)
+    factor_tridiag(bands_L[2, :-1], bands_L[1], bands_L[0, 1:], w, d_prime)
+    disc = np.exp(-r * dt * np.arange(N + 1))
+
+    S_d = cp.asarray(S)
+    K_d = cp.asarray(K_vec)
+    if option_type == "call":
+        V = cp.maximum(S_d[:, None] - K_d[None, :], 0.0)
+    else:
+        V = cp.maximum(K_d[None, :] - S_d[:, None], 0.0)
+    V = cp.ascontiguousarray(V)
+
+    B = K_vec.size
+    blocks = (B + _THREADS_PER_BLOCK - 1) // _THREADS_PER_BLOCK
+    _cn_march(
+        (blocks,),
+        (_THREADS_PER_BLOCK,),
+        (
+            V, K_d, cp.asarray(w), cp.asarray(d_prime), cp.asarray(bands_L[0, 1:]),
+            cp.asarray(bands_R[2, :-1]), cp.asarray(bands_R[1]), cp.asarray(bands_R[0, 1:]),
+            cp.asarray(disc), np.float64(A0), np.float64(Cm), np.float64(Smax), np.float64(dt),
+            np.int32(option_type == "call"), np.int32(M - 1), np.int32(N), np.int32(B),
+        ),
+    )
+
+    # Node-major on the device; the transpose gives one row per option
+    return interp_uniform(cp.asnumpy(V).T, S0_vec, dS)
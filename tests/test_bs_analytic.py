@@ -3,14 +3,22 @@ Unit tests for Black-Scholes analytical solution.
 """
 
 import unittest
+from unittest import mock
 import numpy as np
 import sys
 from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Add the project root to path so the src package (relative imports) loads
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from bs_analytic import call_price, put_price, option_delta, option_gamma
+from scipy.stats import norm
+
+from src.bs_analytic import (
+    bs_call_price, bs_put_price, bs_greeks, bs_price, bs_call_price_batch, bs_price_array,
+    carr_madan_call_curve, _norm_cdf
+)
+from src import bs_analytic
+from src.benchmarks import _carr_madan_batch, benchmark_solver
 
 
 class TestBlackScholesAnalytic(unittest.TestCase):
@@ -26,12 +34,12 @@ class TestBlackScholesAnalytic(unittest.TestCase):
     
     def test_call_price_atm(self):
         """Test call price at-the-money."""
-        price = call_price(
-            spot=self.spot,
-            strike=self.strike,
-            rate=self.rate,
-            volatility=self.volatility,
-            time_to_expiry=self.time_to_expiry
+        price = bs_call_price(
+            S0=self.spot,
+            K=self.strike,
+            T=self.time_to_expiry,
+            r=self.rate,
+            sigma=self.volatility
         )
         # ATM call should be positive
         self.assertGreater(price, 0)
@@ -40,19 +48,19 @@ class TestBlackScholesAnalytic(unittest.TestCase):
     
     def test_put_call_parity(self):
         """Test put-call parity: C - P = S - K*exp(-rT)."""
-        call = call_price(
-            spot=self.spot,
-            strike=self.strike,
-            rate=self.rate,
-            volatility=self.volatility,
-            time_to_expiry=self.time_to_expiry
+        call = bs_call_price(
+            S0=self.spot,
+            K=self.strike,
+            T=self.time_to_expiry,
+            r=self.rate,
+            sigma=self.volatility
         )
-        put = put_price(
-            spot=self.spot,
-            strike=self.strike,
-            rate=self.rate,
-            volatility=self.volatility,
-            time_to_expiry=self.time_to_expiry
+        put = bs_put_price(
+            S0=self.spot,
+            K=self.strike,
+            T=self.time_to_expiry,
+            r=self.rate,
+            sigma=self.volatility
         )
         
         lhs = call - put
@@ -62,39 +70,135 @@ class TestBlackScholesAnalytic(unittest.TestCase):
     
     def test_call_intrinsic_value(self):
         """Test that call price >= intrinsic value."""
-        price = call_price(
-            spot=self.spot,
-            strike=self.strike,
-            rate=self.rate,
-            volatility=self.volatility,
-            time_to_expiry=self.time_to_expiry
+        price = bs_call_price(
+            S0=self.spot,
+            K=self.strike,
+            T=self.time_to_expiry,
+            r=self.rate,
+            sigma=self.volatility
         )
         intrinsic = max(self.spot - self.strike, 0)
         self.assertGreaterEqual(price, intrinsic)
     
     def test_delta_range(self):
         """Test that delta is between 0 and 1 for call."""
-        delta = option_delta(
-            spot=self.spot,
-            strike=self.strike,
-            rate=self.rate,
-            volatility=self.volatility,
-            time_to_expiry=self.time_to_expiry,
+        delta = bs_greeks(
+            S0=self.spot,
+            K=self.strike,
+            T=self.time_to_expiry,
+            r=self.rate,
+            sigma=self.volatility,
             option_type='call'
-        )
+        ).delta
         self.assertGreater(delta, 0)
         self.assertLess(delta, 1)
     
     def test_gamma_positive(self):
         """Test that gamma is always positive."""
-        gamma = option_gamma(
-            spot=self.spot,
-            strike=self.strike,
-            volatility=self.volatility,
-            time_to_expiry=self.time_to_expiry
-        )
+        gamma = bs_greeks(
+            S0=self.spot,
+            K=self.strike,
+            T=self.time_to_expiry,
+            r=self.rate,
+            sigma=self.volatility,
+            option_type='call'
+        ).gamma
         self.assertGreater(gamma, 0)
 
+    def test_call_price_batch(self):
+        """Test the strike-batched call pricer against the scalar one."""
+        strikes = np.array([60.0, 80.0, 100.0, 120.0, 200.0])
+        prices = bs_call_price_batch(self.spot, strikes, self.time_to_expiry, self.rate, self.volatility)
+        expected = [
+            bs_call_price(self.spot, k, self.time_to_expiry, self.rate, self.volatility)
+            for k in strikes
+        ]
+        np.testing.assert_allclose(prices, expected, rtol=1e-12, atol=1e-14)
+
+    def test_price_array_matches_scalar(self):
+        """Test the broadcasting pricer against the scalar one for mixed T and r."""
+        expiries = np.array([0.25, 1.0, 2.0])
+        rates = np.array([0.01, 0.05, 0.1])
+        for option_type in ('call', 'put'):
+            prices = bs_price_array(self.spot, self.strike, expiries, rates, self.volatility, option_type)
+            expected = [
+                bs_price(self.spot, self.strike, t, r, self.volatility, option_type)
+                for t, r in zip(expiries, rates)
+            ]
+            np.testing.assert_allclose(prices, expected, rtol=1e-12)
+
+    def test_norm_cdf_lower_tail(self):
+        """Test that the normal CDF keeps relative precision deep in the tail."""
+        for x in (-8.0, -10.0, -20.0, -37.0):
+            self.assertGreater(_norm_cdf(x), 0.0)
+            np.testing.assert_allclose(_norm_cdf(x), norm.cdf(x), rtol=1e-12)
+
+    def test_deep_otm_call(self):
+        """Test deep out-of-the-money calls against scipy's normal CDF."""
+        for K, T in ((200.0, 0.25), (300.0, 0.1)):
+            d1 = (np.log(self.spot / K) + (self.rate + 0.5 * self.volatility ** 2) * T) / (self.volatility * np.sqrt(T))
+            d2 = d1 - self.volatility * np.sqrt(T)
+            expected = self.spot * norm.cdf(d1) - K * np.exp(-self.rate * T) * norm.cdf(d2)
+            price = bs_price(self.spot, K, T, self.rate, self.volatility, 'call')
+            self.assertGreater(price, 0.0)
+            np.testing.assert_allclose(price, expected, rtol=1e-6)
+
+
+class TestCarrMadan(unittest.TestCase):
+    """Test Carr-Madan FFT pricing against the closed form."""
+
+    def setUp(self):
+        """Set up test parameters."""
+        self.strikes = np.array([80.0, 90.0, 100.0, 110.0, 120.0])
+        self.rate = 0.05
+        self.volatility = 0.2
+        self.time_to_expiry = 1.0
+
+    def bs_prices(self, spots, option_type):
+        """Closed-form prices for the test strikes at ``spots``."""
+        return np.array([
+            bs_price(s, k, self.time_to_expiry, self.rate, self.volatility, option_type)
+            for s, k in zip(np.broadcast_to(spots, self.strikes.shape), self.strikes)
+        ])
+
+    def test_call_curve(self):
+        """Test a call strike curve from one FFT."""
+        prices = carr_madan_call_curve(100.0, self.strikes, self.time_to_expiry, self.rate, self.volatility)
+        np.testing.assert_allclose(prices, self.bs_prices(100.0, 'call'), rtol=0, atol=1e-5)
+
+    def test_batch_puts_via_parity(self):
+        """Test that the benchmark adapter prices puts through put-call parity."""
+        spots = np.full(self.strikes.shape, 100.0)
+        prices = _carr_madan_batch(spots, self.strikes, self.time_to_expiry, self.rate, self.volatility, 'put')
+        np.testing.assert_allclose(prices, self.bs_prices(spots, 'put'), rtol=0, atol=1e-5)
+
+    def test_batch_multiple_spots(self):
+        """Test that each spot in a group gets its own FFT."""
+        spots = np.array([90.0, 110.0, 90.0, 110.0, 90.0])
+        for option_type in ('call', 'put'):
+            prices = _carr_madan_batch(
+                spots, self.strikes, self.time_to_expiry, self.rate, self.volatility, option_type
+            )
+            np.testing.assert_allclose(prices, self.bs_prices(spots, option_type), rtol=0, atol=1e-5)
+
+    def test_benchmark_one_fft_per_spot(self):
+        """Test that the benchmark prices each spot's strike column with one FFT."""
+        params = {
+            'rate': self.rate,
+            'volatility': self.volatility,
+            'time_to_expiry': self.time_to_expiry,
+            'num_space_points': 201,
+            'Smax': 360.0
+        }
+        test_cases = [{'spot': s, 'strike': k} for s in (90.0, 110.0) for k in self.strikes]
+        with mock.patch.object(
+            bs_analytic, 'carr_madan_call_curve', wraps=bs_analytic.carr_madan_call_curve
+        ) as fft:
+            df = benchmark_solver(_carr_madan_batch, params, test_cases, max_workers=1)
+
+        self.assertEqual(fft.call_count, 2)
+        self.assertLess(df['abs_error'].max(), 1e-5)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,70 @@
+"""
+Unit tests for the Numba ufunc Black-Scholes pricer.
+"""
+
+import unittest
+import numpy as np
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('numba')
+
+# Add the project root to path so the src package (relative imports) loads
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bs_analytic import bs_price_array
+from src.bs_analytic_simd import bs_price_u
+
+
+class TestBlackScholesUfunc(unittest.TestCase):
+    """Test bs_price_u against the NumPy/SciPy Black-Scholes pricer."""
+
+    def setUp(self):
+        """Set up test parameters."""
+        self.spots = np.array([60.0, 90.0, 100.0, 110.0, 150.0, 100.0])
+        self.strikes = np.array([100.0, 100.0, 100.0, 100.0, 100.0, 300.0])
+        self.expiries = np.array([0.1, 0.5, 1.0, 2.0, 0.25, 0.1])
+        self.rate = 0.05
+        self.volatility = 0.2
+
+    def test_matches_array_pricer(self):
+        """Test calls and puts with array flags."""
+        for option_type, flag in (('call', 1.0), ('put', -1.0)):
+            expected = bs_price_array(
+                self.spots, self.strikes, self.expiries, self.rate, self.volatility, option_type
+            )
+            flags = np.full(self.spots.shape, flag)
+            prices = bs_price_u(
+                self.spots, self.strikes, self.expiries, self.rate, self.volatility, flags
+            )
+            np.testing.assert_allclose(prices, expected, rtol=1e-10, atol=1e-12)
+
+    def test_scalar_and_int_flags(self):
+        """Test that scalar float and int flags broadcast like array flags."""
+        for option_type, flags in (('call', (1.0, 1)), ('put', (-1.0, -1))):
+            expected = bs_price_array(
+                self.spots, self.strikes, self.expiries, self.rate, self.volatility, option_type
+            )
+            for flag in flags:
+                prices = bs_price_u(
+                    self.spots, self.strikes, self.expiries, self.rate, self.volatility, flag
+                )
+                np.testing.assert_allclose(prices, expected, rtol=1e-10, atol=1e-12)
+
+    def test_scalar_inputs(self):
+        """Test that all-scalar inputs give a scalar price."""
+        expected = bs_price_array(100.0, 100.0, 1.0, self.rate, self.volatility, 'call')
+        price = bs_price_u(100.0, 100.0, 1.0, self.rate, self.volatility, 1)
+        np.testing.assert_allclose(price, expected, rtol=1e-10)
+
+    def test_invalid_inputs_give_nan(self):
+        """Test that invalid parameters give NaN instead of raising."""
+        with np.errstate(invalid='ignore'):
+            prices = bs_price_u(np.array([100.0, -100.0]), np.array([-100.0, 100.0]), 1.0, 0.05, 0.2, 1.0)
+        self.assertTrue(np.isnan(prices).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
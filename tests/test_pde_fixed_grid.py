@@ -2,16 +2,22 @@
 Unit tests for fixed-grid PDE solver.
 """
 
+import subprocess
 import unittest
+from unittest import mock
 import numpy as np
 import sys
 from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Add the project root to path so the src package (relative imports) loads
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from pde_fixed_grid import price_option_fixed_grid
-from bs_analytic import call_price, put_price
+from src import pde_fixed_grid
+from src.pde_fixed_grid import price_european_fixed_grid, price_european_fixed_grid_batch
+from src.bs_analytic import bs_price, bs_call_price
+from src import pde_fixed_grid_cuda
+from src import benchmarks
+from src.benchmarks import benchmark_solver, compare_solvers
 
 
 class TestPDEFixedGrid(unittest.TestCase):
@@ -29,14 +35,14 @@ class TestPDEFixedGrid(unittest.TestCase):
     def test_call_price_reasonable(self):
         """Test that solver produces reasonable option prices."""
         try:
-            price = price_option_fixed_grid(
-                spot=self.spot,
-                strike=self.strike,
-                rate=self.rate,
-                volatility=self.volatility,
-                time_to_expiry=self.time_to_expiry,
-                num_space_points=self.num_space_points,
-                option_type='call'
+            price = price_european_fixed_grid(
+                S0=self.spot,
+                K=self.strike,
+                T=self.time_to_expiry,
+                r=self.rate,
+                sigma=self.volatility,
+                option_type='call',
+                M=self.num_space_points - 1
             )
             # Price should be positive and less than spot
             self.assertGreater(price, 0)
@@ -47,26 +53,26 @@ class TestPDEFixedGrid(unittest.TestCase):
     def test_convergence_with_grid_refinement(self):
         """Test that error decreases with grid refinement."""
         try:
-            bs_price = call_price(
-                spot=self.spot,
-                strike=self.strike,
-                rate=self.rate,
-                volatility=self.volatility,
-                time_to_expiry=self.time_to_expiry
+            bs_ref = bs_call_price(
+                S0=self.spot,
+                K=self.strike,
+                T=self.time_to_expiry,
+                r=self.rate,
+                sigma=self.volatility
             )
             
             errors = []
             for num_points in [51, 101, 201]:
-                price = price_option_fixed_grid(
-                    spot=self.spot,
-                    strike=self.strike,
-                    rate=self.rate,
-                    volatility=self.volatility,
-                    time_to_expiry=self.time_to_expiry,
-                    num_space_points=num_points,
-                    option_type='call'
+                price = price_european_fixed_grid(
+                    S0=self.spot,
+                    K=self.strike,
+                    T=self.time_to_expiry,
+                    r=self.rate,
+                    sigma=self.volatility,
+                    option_type='call',
+                    M=num_points - 1
                 )
-                error = abs(price - bs_price)
+                error = abs(price - bs_ref)
                 errors.append(error)
             
             # Errors should generally decrease
@@ -74,6 +80,247 @@ class TestPDEFixedGrid(unittest.TestCase):
         except NotImplementedError:
             self.skipTest("PDE fixed grid solver not yet implemented")
 
+    def test_call_matches_black_scholes(self):
+        """Test that the call price agrees with the analytical price."""
+        price = price_european_fixed_grid(
+            self.spot, self.strike, self.time_to_expiry, self.rate, self.volatility, 'call',
+            M=self.num_space_points - 1
+        )
+        bs_ref = bs_price(self.spot, self.strike, self.time_to_expiry, self.rate, self.volatility, 'call')
+        self.assertAlmostEqual(price, bs_ref, delta=1e-2)
+
+
+    def test_return_grid_surface(self):
+        """Test the float32 surface and that return_grid does not change the price."""
+        for option_type in ('call', 'put'):
+            price = price_european_fixed_grid(
+                self.spot, self.strike, self.time_to_expiry, self.rate, self.volatility, option_type,
+                M=120, N=60
+            )
+            price_grid, info = price_european_fixed_grid(
+                self.spot, self.strike, self.time_to_expiry, self.rate, self.volatility, option_type,
+                M=120, N=60, return_grid=True
+            )
+            surface = info['surface']
+            self.assertEqual(surface.dtype, np.float32)
+            self.assertEqual(surface.shape, (61, 121))
+            np.testing.assert_array_equal(surface[-1], info['V_tau_T'].astype(np.float32))
+            self.assertEqual(price_grid, price)
+
+class TestPDEFixedGridBatch(unittest.TestCase):
+    """Test the batched fixed-grid solver."""
+
+    def setUp(self):
+        """Set up test parameters."""
+        self.spots = np.array([95.0, 100.0, 100.3, 105.0, 119.99])
+        self.strikes = np.array([80.0, 90.0, 100.0, 110.0, 120.0])
+        self.rate = 0.05
+        self.volatility = 0.2
+        self.time_to_expiry = 1.0
+        self.smax = 360.0
+
+    def test_batch_matches_single_solves(self):
+        """Test that batch prices equal per-option solves on the same grid."""
+        for option_type in ('call', 'put'):
+            batch = price_european_fixed_grid_batch(
+                self.spots, self.strikes, self.time_to_expiry, self.rate, self.volatility,
+                option_type, M=120, N=60, Smax=self.smax
+            )
+            single = [
+                price_european_fixed_grid(
+                    s, k, self.time_to_expiry, self.rate, self.volatility,
+                    option_type, M=120, N=60, Smax=self.smax
+                )
+                for s, k in zip(self.spots, self.strikes)
+            ]
+            np.testing.assert_allclose(batch, single, rtol=0, atol=1e-12)
+
+
+class TestLapackFallback(unittest.TestCase):
+    """Test the LAPACK dgttrf/dgttrs stepper used when Numba is unavailable."""
+
+    def test_fallback_matches_numba(self):
+        """Test that both steppers give the same prices, single and batched."""
+        spots = np.array([90.0, 100.0, 110.0])
+        strikes = np.array([95.0, 100.0, 105.0])
+        for option_type in ('call', 'put'):
+            single = price_european_fixed_grid(100.0, 100.0, 1.0, 0.05, 0.2, option_type, M=120, N=60)
+            batch = price_european_fixed_grid_batch(spots, strikes, 1.0, 0.05, 0.2, option_type, M=120, N=60)
+            with mock.patch.object(pde_fixed_grid, 'HAVE_NUMBA', False):
+                single_fb = price_european_fixed_grid(100.0, 100.0, 1.0, 0.05, 0.2, option_type, M=120, N=60)
+                batch_fb = price_european_fixed_grid_batch(spots, strikes, 1.0, 0.05, 0.2, option_type, M=120, N=60)
+            self.assertAlmostEqual(single_fb, single, places=10)
+            np.testing.assert_allclose(batch_fb, batch, rtol=0, atol=1e-10)
+
+
+class TestBenchmarkSolver(unittest.TestCase):
+    """Test grouping and row handling in benchmark_solver."""
+
+    def setUp(self):
+        """Set up test parameters."""
+        self.params = {
+            'rate': 0.05,
+            'volatility': 0.2,
+            'time_to_expiry': 1.0,
+            'num_space_points': 201,
+            'Smax': 1200.0
+        }
+
+    def test_rows_keep_input_order(self):
+        """Test that rows come back in test-case order across groups."""
+        test_cases = [
+            {'spot': 100.0, 'strike': 110.0, 'option_type': 'put'},
+            {'spot': 100.0, 'strike': 90.0, 'option_type': 'call'},
+            {'spot': 400.0, 'strike': 400.0, 'option_type': 'call'},
+            {'spot': 100.0, 'strike': 100.0, 'option_type': 'put'},
+        ]
+        df = benchmark_solver(price_european_fixed_grid_batch, self.params, test_cases)
+
+        np.testing.assert_array_equal(df['strike'], [110.0, 90.0, 400.0, 100.0])
+        np.testing.assert_array_equal(df['spot'], [100.0, 100.0, 400.0, 100.0])
+        for row, case in zip(df.itertuples(), test_cases):
+            expected = price_european_fixed_grid(
+                case['spot'], case['strike'], 1.0, 0.05, 0.2, case['option_type'], M=200, Smax=1200.0
+            )
+            self.assertAlmostEqual(row.solver_price, expected, places=10)
+
+    def test_error_independent_of_other_cases(self):
+        """Test that with a fixed Smax, other cases do not change a case's error."""
+        atm = {'spot': 100.0, 'strike': 100.0}
+        alone = benchmark_solver(price_european_fixed_grid_batch, self.params, [atm])
+        mixed = benchmark_solver(
+            price_european_fixed_grid_batch, self.params,
+            [atm, {'spot': 400.0, 'strike': 400.0}, {'spot': 100.0, 'strike': 80.0}]
+        )
+        self.assertEqual(alone['abs_error'].iloc[0], mixed['abs_error'].iloc[0])
+
+    def test_shared_grid_cases_batched(self):
+        """Test that cases sharing rate, vol, expiry and type are solved in one call."""
+        calls = []
+
+        def solver(S0, K, T, r, sigma, option_type, **kwargs):
+            calls.append(len(K))
+            return price_european_fixed_grid_batch(S0, K, T, r, sigma, option_type, **kwargs)
+
+        test_cases = [{'spot': 100.0, 'strike': k, 'option_type': 'call'} for k in (80, 90, 100, 110, 120)]
+        test_cases.append({'spot': 100.0, 'strike': 100.0, 'option_type': 'put'})
+        df = benchmark_solver(solver, self.params, test_cases, max_workers=1)
+
+        self.assertEqual(sorted(calls), [1, 5])
+        self.assertEqual(len(df), 6)
+
+    def test_cuda_device_gets_whole_batch(self):
+        """Test that compare_solvers(device='cuda') sends each group as one batch."""
+        batch_sizes = []
+
+        def fake_cuda(S0, K, T, r, sigma, option_type, **kwargs):
+            batch_sizes.append(len(K))
+            return price_european_fixed_grid_batch(S0, K, T, r, sigma, option_type, **kwargs)
+
+        test_cases = [{'spot': 100.0, 'strike': k} for k in np.linspace(60.0, 140.0, 41)]
+        with mock.patch.object(pde_fixed_grid_cuda, 'price_batch_cuda', fake_cuda):
+            results = compare_solvers(test_cases, self.params, device='cuda')
+
+        self.assertEqual(batch_sizes, [41])
+        self.assertEqual(len(results['fixed_grid']), 41)
+
+    def test_on_rows_streams_each_group(self):
+        """Test that on_rows gets every solved group's rows once, as they finish."""
+        batches = []
+        test_cases = [
+            {'spot': 100.0, 'strike': 90.0, 'option_type': 'call'},
+            {'spot': 100.0, 'strike': 100.0, 'option_type': 'put'},
+            {'spot': 100.0, 'strike': 110.0, 'option_type': 'call'},
+        ]
+        df = benchmark_solver(
+            price_european_fixed_grid_batch, self.params, test_cases, max_workers=1, on_rows=batches.append
+        )
+
+        self.assertEqual([len(rows) for rows in batches], [2, 1])
+        streamed = sorted(row for rows in batches for row in rows)
+        self.assertEqual(streamed, sorted(df.itertuples(index=False, name=None)))
+
+    def test_reference_without_numba(self):
+        """Test that the SciPy reference fallback matches the Numba ufunc."""
+        test_cases = [
+            {'spot': 100.0, 'strike': k, 'option_type': t}
+            for k in (80.0, 100.0, 120.0) for t in ('call', 'put')
+        ]
+        expected = benchmark_solver(price_european_fixed_grid_batch, self.params, test_cases)
+        with mock.patch.object(benchmarks, 'bs_price_u', None):
+            df = benchmark_solver(price_european_fixed_grid_batch, self.params, test_cases)
+        np.testing.assert_allclose(df['bs_price'], expected['bs_price'], rtol=1e-10)
+
+    def test_benchmarks_import_without_numba(self):
+        """Test that benchmarks imports and runs with Numba unavailable."""
+        code = (
+            "import sys; sys.modules['numba'] = None\n"
+            "from src import benchmarks, pde_fixed_grid\n"
+            "assert benchmarks.bs_price_u is None and not pde_fixed_grid.HAVE_NUMBA\n"
+            "df = benchmarks.benchmark_solver(pde_fixed_grid.price_european_fixed_grid_batch,\n"
+            "    {'rate': 0.05, 'volatility': 0.2, 'time_to_expiry': 1.0, 'Smax': 300.0},\n"
+            "    [{'spot': 100.0, 'strike': 100.0}], max_workers=1)\n"
+            "assert df['abs_error'].iloc[0] < 1e-2\n"
+        )
+        subprocess.run([sys.executable, '-c', code], cwd=Path(__file__).parent.parent, check=True)
+
+    def pool_cases(self):
+        """Eight groups: four rates times call/put, two strikes each."""
+        return [
+            {'spot': 100.0, 'strike': k, 'rate': r, 'volatility': 0.2, 'option_type': t}
+            for r in (0.01, 0.03, 0.05, 0.07) for t in ('call', 'put') for k in (90.0, 110.0)
+        ]
+
+    def test_process_pool_matches_serial(self):
+        """Test that groups solved in a process pool match the serial run."""
+        params = {'time_to_expiry': 1.0, 'num_space_points': 101, 'Smax': 330.0}
+        serial = benchmark_solver(price_european_fixed_grid_batch, params, self.pool_cases(), max_workers=1)
+        with mock.patch.object(
+            benchmarks, 'ProcessPoolExecutor', wraps=benchmarks.ProcessPoolExecutor
+        ) as pool:
+            pooled = benchmark_solver(price_european_fixed_grid_batch, params, self.pool_cases(), max_workers=2)
+
+        pool.assert_called_once()
+        self.assertEqual(len(pooled), 16)
+        np.testing.assert_allclose(pooled.to_numpy(), serial.to_numpy(), rtol=0, atol=1e-12)
+
+    def test_unpicklable_solver_runs_serially(self):
+        """Test that a closure solver skips the pool instead of failing."""
+        def solver(S0, K, T, r, sigma, option_type, **kwargs):
+            return price_european_fixed_grid_batch(S0, K, T, r, sigma, option_type, **kwargs)
+
+        params = {'time_to_expiry': 1.0, 'num_space_points': 101, 'Smax': 330.0}
+        with mock.patch.object(benchmarks, 'ProcessPoolExecutor') as pool:
+            df = benchmark_solver(solver, params, self.pool_cases(), max_workers=2)
+
+        pool.assert_not_called()
+        self.assertEqual(len(df), 16)
+
+    def test_conflicting_params_raise(self):
+        """Test that a test case repeating a key from params is rejected."""
+        with self.assertRaises(ValueError):
+            benchmark_solver(
+                price_european_fixed_grid_batch, self.params,
+                [{'spot': 100.0, 'strike': 100.0, 'rate': 0.01}]
+            )
+
+    def test_failed_group_rows_dropped(self):
+        """Test that a group whose solver raises is dropped, others kept."""
+        def solver(S0, K, T, r, sigma, option_type, **kwargs):
+            if option_type == 'put':
+                raise RuntimeError("put solver failed")
+            return price_european_fixed_grid_batch(S0, K, T, r, sigma, option_type, **kwargs)
+
+        test_cases = [
+            {'spot': 100.0, 'strike': 90.0, 'option_type': 'call'},
+            {'spot': 100.0, 'strike': 100.0, 'option_type': 'put'},
+            {'spot': 100.0, 'strike': 110.0, 'option_type': 'call'},
+        ]
+        df = benchmark_solver(solver, self.params, test_cases, max_workers=1)
+
+        np.testing.assert_array_equal(df['strike'], [90.0, 110.0])
+        self.assertTrue(np.isfinite(df['solver_price']).all())
+
 
 if __name__ == '__main__':
     unittest.main()
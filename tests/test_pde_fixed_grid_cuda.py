@@ -0,0 +1,43 @@
+"""
+Unit tests for the CuPy batched fixed-grid PDE solver.
+"""
+
+import unittest
+import numpy as np
+import sys
+from pathlib import Path
+
+import pytest
+
+cp = pytest.importorskip('cupy')
+
+# Add the project root to path so the src package (relative imports) loads
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pde_fixed_grid import price_european_fixed_grid_batch
+from src.pde_fixed_grid_cuda import price_batch_cuda
+
+
+def _have_device():
+    try:
+        return cp.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+@unittest.skipUnless(_have_device(), "no CUDA device")
+class TestPDEFixedGridCuda(unittest.TestCase):
+    """Test the GPU solver against the CPU batch solver."""
+
+    def test_matches_cpu_batch(self):
+        """Test calls and puts, including a batch spanning several blocks."""
+        strikes = np.linspace(60.0, 140.0, 300)
+        spots = np.linspace(90.0, 110.0, 300)
+        for option_type in ('call', 'put'):
+            expected = price_european_fixed_grid_batch(spots, strikes, 1.0, 0.05, 0.2, option_type, M=120, N=60)
+            prices = price_batch_cuda(spots, strikes, 1.0, 0.05, 0.2, option_type, M=120, N=60)
+            np.testing.assert_allclose(prices, expected, rtol=0, atol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()